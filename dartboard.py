@@ -15,9 +15,52 @@ using the associated probability of occurrence.
 
 Copyright 2023, Sammy Sousa Software, LLC.
 """
+from array import array
+from bisect import bisect_right
+from heapq import nlargest
+from itertools import accumulate, groupby
 import math
 import random
 
+try:
+    import numpy
+except ImportError:
+    # NumPy is optional; without it, batched sampling falls back to repeated
+    # single draws.
+    numpy = None
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it, sampleCounts falls back to the
+    # interpreted sampling loop.
+    njit = None
+
+if numpy is not None and njit is not None:
+    @njit(cache=True)
+    def _sampleAlias(alias_prob, alias_idx, group_lens, group_offsets,
+                     flat_nums, out, seed):
+        """Fill `out` with alias-table draws; compiled to machine code by Numba."""
+        if seed >= 0:
+            numpy.random.seed(seed)
+        group_count = alias_prob.shape[0]
+        for j in range(out.shape[0]):
+            i = int(numpy.random.random() * group_count)
+            if numpy.random.random() >= alias_prob[i]:
+                i = alias_idx[i]
+            length = group_lens[i]
+            if length == 1:
+                out[j] = flat_nums[group_offsets[i]]
+            else:
+                out[j] = flat_nums[group_offsets[i]
+                                   + int(numpy.random.random() * length)]
+else:
+    _sampleAlias = None
+
+# Largest expanded selection table (in 8-byte slots) that will be traded for
+# the one-draw flat sampling path; beyond this the alias table alone is used.
+FLAT_TABLE_MAX_SLOTS = 1 << 20
+
 
 class DartBoard:
     """DartBoard class:
@@ -27,6 +70,22 @@ class DartBoard:
         method:             getNumber()
     """
 
+    # Fixed slots instead of a per-instance __dict__: attribute access in the
+    # sampling hot path becomes a C-struct offset load rather than a string
+    # hash, and each instance sheds the dictionary overhead. getNumber is a
+    # slot (not a class method) because __init__ always binds the sampler
+    # selected by get_method.
+    __slots__ = ('numbers', 'probabilities', 'seed', 'method',
+                 'population_size', 'tier_one_size', 'min_prob', 'normalizer',
+                 'prob_rounder', 'group_probs', 'group_nums', 'group_lens',
+                 'singleton_count', '_singleton_nums', 'alias_mask',
+                 'alias_prob', 'alias_idx', 'alias_threshold',
+                 'selection_table', 'selection_table_len', 'cum_weights',
+                 'total_weight', 'cum_weights_simple', 'weights', '__numbers',
+                 'getNumber', '_rng', '_getrandbits', '_randrange', '_random',
+                 '_np_rng', '_np_flat_nums', '_np_alias_prob', '_np_alias_idx',
+                 '_np_group_lens', '_np_group_offsets')
+
     def __init__(self, number_probability_list: 'list',
                  *, seed: 'float' = None, get_method: str = None):
         """
@@ -34,7 +93,8 @@ class DartBoard:
         :keyword seed:                      Optional seed for random number generation
         :keyword get_method:                For test purpose only, if 'simple' use a simple
                                             random.choice method for returned number selection;
-                                            otherwise, use the two-tier selection method.
+                                            if 'bisect' use cumulative weights with a binary
+                                            search; otherwise, use the two-tier selection method.
         """
 
         if not number_probability_list:
@@ -42,47 +102,68 @@ class DartBoard:
                                  "(number,probability) pairs")
 
         # Because many transformations are performed on the probabilities,
-        # separate the numbers and probabilities into two lists.
-        self.numbers = []
-        self.probabilities = []
+        # separate the numbers and probabilities into two lists. The zip
+        # transpose does the split in C instead of an append per pair.
         self.seed = seed
         self.method = get_method
 
-        for n, p in number_probability_list:
-            self.numbers.append(n)
-            self.probabilities.append(p)
+        self.numbers, self.probabilities = map(list, zip(*number_probability_list))
         self.population_size = len(self.numbers)
             
         self.tier_one_size = 0
 
-        random.seed(seed)
+        # A dedicated generator rather than the module-global one: two
+        # DartBoards no longer share (or disturb) each other's sequence, and
+        # the bound methods below are direct C calls on the instance, skipping
+        # the module indirection on the sampling hot path.
+        self._rng = random.Random(seed)
+        self._getrandbits = self._rng.getrandbits
+        self._randrange = self._rng.randrange
+        self._random = self._rng.random
+        # A separate NumPy generator backs the vectorized getNumbers path.
+        # numpy.random.default_rng requires an integer seed.
+        self._np_rng = None
+        self._np_flat_nums = None
+        if numpy is not None:
+            self._np_rng = numpy.random.default_rng(
+                None if seed is None else int(seed))
 
         self._checkInput()
 
         if self.method == 'simple':
             self.getNumber = self._getNumberSimple
-            self.__numbers = []
-            self.weights = []
-            for (n, p) in number_probability_list:
-                self.__numbers.append(n)
-                self.weights.append(p)
+            # Alias the lists built above rather than copying them; the
+            # normalization step rebinds (not mutates) self.numbers and
+            # self.probabilities, so these keep the original input order.
+            self.__numbers = self.numbers
+            self.weights = self.probabilities
+            # random.choices recomputes the cumulative weights on every call
+            # when given plain weights; accumulate them once here so each draw
+            # is just a binary search.
+            self.cum_weights_simple = list(accumulate(self.weights))
         elif self.method in [None, 'two-tier', 'twotier', 'two']:
             self.getNumber = self._getNumberTwoTier
+        elif self.method == 'bisect':
+            self.getNumber = self._getNumberBisect
         else:
             raise ValueError(f"Invalid get_method: {self.method}")
 
 
     def _checkInput(self):
         """Verify no duplicate number and probabilities < 1.0"""
-        number_dup_check = {}
-        for i, n in enumerate(self.numbers):
-            if n in number_dup_check:
-                raise ValueError(f"Number {n} in position {i} is a "
-                                     f"duplicate of position {number_dup_check[n]}")
-            number_dup_check[n] = i
-        for i, p in enumerate(self.probabilities):
-            if p >= 1.0:
-                raise ValueError(f"Probability of {p} in position {i} is 1.0 or more")
+        # The common (valid) case is decided by one C-level set build; only a
+        # failing input pays the Python walk to pinpoint the duplicate.
+        if len(set(self.numbers)) != self.population_size:
+            number_dup_check = {}
+            for i, n in enumerate(self.numbers):
+                if n in number_dup_check:
+                    raise ValueError(f"Number {n} in position {i} is a "
+                                         f"duplicate of position {number_dup_check[n]}")
+                number_dup_check[n] = i
+        bad = next((i for i, p in enumerate(self.probabilities) if p >= 1.0), -1)
+        if bad >= 0:
+            raise ValueError(f"Probability of {self.probabilities[bad]} in "
+                                 f"position {bad} is 1.0 or more")
 
     def _normalizeProbabilities(self):
         """Discover the minimum probability and use it as a normalizer, such that
@@ -105,76 +186,399 @@ class DartBoard:
         self.normalizer = 1.0 / self.min_prob
 
         rounder = 3 if self.population_size < 1000 else 2 if self.population_size < 100000 else 1
-
-        # Create a new list of probability/number pairs, using rounded normalized probabilities.
-        probs = [round(p * self.normalizer, rounder) for p in self.probabilities]
-        prob_nums = list(zip(probs, self.numbers))
-
-        # This new list can be sorted on the rounded normalized probabilities, allowing the
-        # numbers for same probabilities to be combined into lists. Note that the original
-        # numbers and probabilities list can be discarded (to reduce overall memory footprint).
-        prob_nums.sort()
-        self.probabilities, self.numbers = map(list, zip(*prob_nums))
+        self.prob_rounder = rounder
+
+        # Round the normalized probabilities and sort them (carrying the numbers
+        # along), allowing the numbers for same probabilities to be combined into
+        # lists. Note that the original numbers and probabilities lists can be
+        # discarded (to reduce overall memory footprint).
+        if numpy is not None:
+            # Rounding, and sorting by index, both happen in C; the Python-level
+            # tuple comparisons of a list sort dominate this step for large
+            # populations. Single precision halves the bytes moved through the
+            # caches, and is safe because the rounding below quantizes to at
+            # most three decimal digits anyway.
+            probs = numpy.round(numpy.array(self.probabilities,
+                                            dtype=numpy.float32)
+                                * numpy.float32(self.normalizer), rounder)
+            order = numpy.argsort(probs, kind='stable')
+            self.probabilities = probs[order].tolist()
+            self.numbers = [self.numbers[i] for i in order]
+        else:
+            probs = [round(p * self.normalizer, rounder) for p in self.probabilities]
+            prob_nums = list(zip(probs, self.numbers))
+            prob_nums.sort()
+            self.probabilities, self.numbers = map(list, zip(*prob_nums))
 
     def _createWeightGroups(self):
-        """Using the sorted normalized probabilities, create a list of weight groups such that
-        each list member is composed of the normalized priority and a list of associated numbers.
+        """Using the sorted normalized probabilities, create the weight groups: for each
+        unique normalized probability, the typed array of associated numbers.
 
-        [ 1.0, [1, 3, 9, 27, ...],
-        [ 1.01, [93, 129, 256, ...], ...
+        The groups are kept as parallel lists (structure-of-arrays) rather than a
+        list of (probability, numbers) tuples, so the sampling hot path indexes
+        straight into the lists it needs without a per-draw tuple unpack:
+
+            group_probs:    [ 1.0, 1.01, ... ]
+            group_nums:     [ array('q', [1, 3, 9, ...]), array('q', [93, ...]), ... ]
+            group_lens:     [ 4, 3, ... ]
+        """
+        # The probabilities are already sorted, so consecutive equal values form
+        # the groups; groupby walks them in C rather than testing each element
+        # against the previous one in Python.
+        self.group_probs = []
+        self.group_nums = []
+        for p, pairs in groupby(zip(self.probabilities, self.numbers),
+                                key=lambda pair: pair[0]):
+            self.group_probs.append(p)
+            # A typed array stores the members in contiguous 8-byte cells --
+            # one-third the memory of a list of Python ints, and a direct
+            # C-level load when indexed by the samplers.
+            self.group_nums.append(array('q', (n for _, n in pairs)))
+
+        # Partition the groups so that all single-member groups occupy the low
+        # indices, with their numbers stored inline in a typed array (one
+        # contiguous 8-byte cell each). After rounding, singletons are the
+        # common case, and this lets the samplers return their number with a
+        # single index-range test and array load -- no wrapper list, no
+        # second random draw.
+        singles = [i for i, nums in enumerate(self.group_nums) if len(nums) == 1]
+        multis = [i for i, nums in enumerate(self.group_nums) if len(nums) > 1]
+        order = singles + multis
+        self.group_probs = [self.group_probs[i] for i in order]
+        self.group_nums = [self.group_nums[i] for i in order]
+        self.group_lens = [len(nums) for nums in self.group_nums]
+        self.singleton_count = len(singles)
+        self._singleton_nums = array('q', (self.group_nums[i][0]
+                                           for i in range(self.singleton_count)))
+        self.tier_one_size = len(self.group_probs)
+
+    def _createAliasTable(self):
+        """Create a Walker/Vose alias table over the weight groups.
+
+        The previous scheme expanded every weight group into a selection table with
+        one slot per unit of weight, so the table size grew with the sum of the
+        scaled probabilities (enormous when the minimum probability is tiny). The
+        alias method instead builds just two parallel lists, each with one entry
+        per weight group: an acceptance probability and an alias group index.
+
+        A group is selected by drawing one uniform group index, then either keeping
+        it (with its acceptance probability) or redirecting to its alias. This gives
+        the same distribution as the big table with O(tier_one_size) memory and
+        constant work per draw.
         """
-        self.weight_groups = []
-        group = []
-        previous = -1
-        for i in range(self.population_size):
-            n = self.numbers[i]
-            p = self.probabilities[i]
-            if p != previous:
-                if previous != -1:
-                    self.weight_groups.append((previous,  group))
-                group = []
-                previous = p
-            group.append(n)
-        if group:
-            self.weight_groups.append((p, group))
-
-        self.tier_one_size = len(self.weight_groups)
+        # Pad the table to the next power of two with zero-weight entries
+        # (which always redirect to their alias), so the tier-one index can be
+        # taken as a bit-mask of the random draw instead of a multiply-shift
+        # reduction. The padded entries' aliases point at real groups, so the
+        # distribution is unchanged.
+        group_count = 1 << (self.tier_one_size - 1).bit_length()
+        self.alias_mask = group_count - 1
+        weights = [p * n for p, n in zip(self.group_probs, self.group_lens)]
+        weights += [0.0] * (group_count - self.tier_one_size)
+        total = sum(weights)
+
+        self.alias_prob = [0.0] * group_count
+        self.alias_idx = list(range(group_count))
+
+        # Scale each group weight so the average is 1.0, then pair each
+        # under-weighted ("small") group with an over-weighted ("large") one,
+        # giving the small group's slack to the large group's alias.
+        scale = group_count / total
+        scaled = [w * scale for w in weights]
+        small = [i for i, s in enumerate(scaled) if s < 1.0]
+        large = [i for i, s in enumerate(scaled) if s >= 1.0]
+        # Bind the tables as locals; the pairing loop runs once per group and
+        # the attribute lookups would otherwise repeat on every iteration.
+        alias_prob = self.alias_prob
+        alias_idx = self.alias_idx
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            alias_prob[s] = scaled[s]
+            alias_idx[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+        # Whatever remains (from floating-point drift) always accepts itself;
+        # a leftover padded entry instead redirects to the heaviest real group,
+        # since its own index has no number list behind it.
+        heaviest = max(range(self.tier_one_size), key=weights.__getitem__)
+        for i in small + large:
+            if i < self.tier_one_size:
+                self.alias_prob[i] = 1.0
+            else:
+                self.alias_idx[i] = heaviest
+
+        # The acceptance probabilities scaled to 32-bit integers (stored in
+        # 4-byte cells), so the hot path can compare them against raw random
+        # bits instead of a float. A certain acceptance saturates to the
+        # maximum threshold; the one-in-2**32 spurious redirect that allows
+        # lands on the entry's own (identity) alias, so it is harmless.
+        self.alias_threshold = array('I', (min(int(p * 0x100000000), 0xFFFFFFFF)
+                                           for p in self.alias_prob))
+
+        # Mirror the tables as NumPy arrays (with the group member lists
+        # flattened alongside per-group offsets) so getNumbers can vectorize.
+        if numpy is not None:
+            self._np_alias_prob = numpy.array(self.alias_prob,
+                                              dtype=numpy.float32)
+            self._np_alias_idx = numpy.array(self.alias_idx, dtype=numpy.int64)
+            self._np_group_lens = numpy.array(self.group_lens, dtype=numpy.int64)
+            self._np_group_offsets = (numpy.cumsum(self._np_group_lens)
+                                      - self._np_group_lens)
+            self._np_flat_nums = numpy.array(
+                [n for nums in self.group_nums for n in nums],
+                dtype=numpy.int64)
 
     def _createSelectionTable(self):
-        """Create a random selection table where each weight group is repeated for
-        respective probability and for each member.
-
-        Because of the possible immensity of selection table, the corresponding
-        dictionary element is deleted (popped) as creation of the table proceeds.
+        """Create a flat selection table holding one final number per slot,
+        when it fits within FLAT_TABLE_MAX_SLOTS.
+
+        Each group's members are repeated round(probability * 10**rounder)
+        times, so a slot picked uniformly already encodes the final number:
+        sampling is one random draw and one typed-array load, with no alias
+        test and no tier-two pick. This trades memory for time, so the table
+        is only built when the slot count fits the budget; larger populations
+        rely on the alias table alone.
+        """
+        scale = 10 ** self.prob_rounder
+        slot_count = sum(round(p * scale) * n
+                         for p, n in zip(self.group_probs, self.group_lens))
+        if slot_count > FLAT_TABLE_MAX_SLOTS:
+            self.selection_table = None
+            self.selection_table_len = 0
+            return
+        table = array('q')
+        for p, nums in zip(self.group_probs, self.group_nums):
+            table.extend(nums * round(p * scale))
+        self.selection_table = table
+        self.selection_table_len = len(table)
+
+    def _createCumulativeTable(self):
+        """Create a cumulative-weights table over the weight groups.
+
+        The running total of each group weight (probability times member count)
+        supports tier-one selection by binary search: draw a uniform value below
+        the grand total and bisect for the group owning that interval. Memory is
+        O(tier_one_size) and each draw costs O(log tier_one_size).
+        """
+        self.cum_weights = list(accumulate(p * n for p, n in
+                                           zip(self.group_probs, self.group_lens)))
+        self.total_weight = self.cum_weights[-1]
+
+    def _specializeGetNumber(self):
+        """Rebind getNumber to a closure specialized for the built tables.
+
+        Once createTable has run, the table references, their lengths and the
+        bound RNG methods are all constants; baking them into a closure's free
+        variables replaces every per-call attribute lookup with a direct cell
+        load. The closure chosen also exploits the table shape: a flat
+        selection table (when its memory budget allowed building it) answers
+        every draw with a single load; failing that, a single weight group
+        makes every draw a uniform pick from that group, and an all-singleton
+        table makes the tier-two draw unreachable. The simple and bisect
+        methods get the same treatment over their own tables.
         """
-        self.selection_table = []
-        for p,nums in self.weight_groups:
-            nums_len = len(nums)
-            w = int(p * nums_len)
-            for _ in range(w):
-                self.selection_table.append((nums_len, nums))
-        self.selection_table_len = len(self.selection_table)
+        getrandbits = self._getrandbits
+        if self.method == 'simple':
+            choices = self._rng.choices
+            nums = self.__numbers
+            cum = self.cum_weights_simple
+            self.getNumber = lambda: choices(nums, cum_weights=cum, k=1)[0]
+        elif self.method == 'bisect':
+            cum = self.cum_weights
+            total = self.total_weight
+            rand = self._random
+            randrange = self._randrange
+            singleton_count = self.singleton_count
+            singleton_nums = self._singleton_nums
+            group_nums = self.group_nums
+            group_lens = self.group_lens
+
+            def bisect_sampler():
+                index = bisect_right(cum, rand() * total)
+                if index < singleton_count:
+                    return singleton_nums[index]
+                return group_nums[index][randrange(group_lens[index])]
+
+            self.getNumber = bisect_sampler
+        elif self.selection_table is not None:
+            table = self.selection_table
+            table_len = self.selection_table_len
+            self.getNumber = lambda: table[getrandbits(32) * table_len >> 32]
+        elif self.tier_one_size == 1:
+            nums = self.group_nums[0]
+            nums_len = self.group_lens[0]
+            self.getNumber = lambda: nums[getrandbits(32) * nums_len >> 32]
+        elif self.singleton_count == self.tier_one_size:
+            alias_mask = self.alias_mask
+            threshold = self.alias_threshold
+            alias_idx = self.alias_idx
+            nums = self._singleton_nums
+
+            def singleton_sampler():
+                rand = getrandbits(64)
+                index = (rand >> 32) & alias_mask
+                if (rand & 0xFFFFFFFF) >= threshold[index]:
+                    index = alias_idx[index]
+                return nums[index]
+
+            self.getNumber = singleton_sampler
+        else:
+            alias_mask = self.alias_mask
+            threshold = self.alias_threshold
+            alias_idx = self.alias_idx
+            singleton_count = self.singleton_count
+            singleton_nums = self._singleton_nums
+            group_nums = self.group_nums
+            group_lens = self.group_lens
+
+            def two_tier_sampler():
+                rand = getrandbits(64)
+                index = (rand >> 32) & alias_mask
+                if (rand & 0xFFFFFFFF) >= threshold[index]:
+                    index = alias_idx[index]
+                if index < singleton_count:
+                    return singleton_nums[index]
+                return group_nums[index][getrandbits(32)
+                                         * group_lens[index] >> 32]
+
+            self.getNumber = two_tier_sampler
 
     def _getNumberSimple(self):
-        """Return a randomly selected number using the stock random.choices method"""
-        return random.choices(self.__numbers, self.weights, k=1)[0]
+        """Return a randomly selected number using the stock random.choices method,
+        supplying the precomputed cumulative weights so each call is O(log n)
+        rather than a fresh O(n) accumulation."""
+        return self._rng.choices(self.__numbers,
+                                 cum_weights=self.cum_weights_simple, k=1)[0]
 
     def _getNumberTwoTier(self):
-        """Return a randomly selected number using the two-tier look-up scheme"""
-        rand = random.randrange(self.selection_table_len)
-        nums_len, nums = self.selection_table[rand]
-        if nums_len == 1:
-            number = nums[0]
-        else:
-            rand = random.randrange(nums_len)
-            number = nums[rand]
-        return number
-
-    def getNumber(self):
-        """Return a randomly selected number--virtual method replaced with simple or two-tier"""
-        print("ERROR: getNumber not implemented")
+        """Return a randomly selected number using the two-tier look-up scheme.
+
+        Tier one picks a weight group via the alias table; tier two picks
+        uniformly within the group. One 64-bit draw covers both tier-one steps:
+        the alias table is padded to a power of two, so the high 32 bits become
+        a slot index with a plain bit-mask (no modulo, no randrange wrapper) and
+        the low 32 bits serve as the accept-or-redirect test against the scaled
+        alias threshold. Only a multi-member group costs a second (32-bit) draw.
+        """
+        rand = self._getrandbits(64)
+        index = (rand >> 32) & self.alias_mask
+        if (rand & 0xFFFFFFFF) >= self.alias_threshold[index]:
+            index = self.alias_idx[index]
+        if index < self.singleton_count:
+            return self._singleton_nums[index]
+        nums_len = self.group_lens[index]
+        return self.group_nums[index][self._getrandbits(32) * nums_len >> 32]
+
+    def _getNumberBisect(self):
+        """Return a randomly selected number using cumulative weights and bisection.
+
+        Tier one locates the weight group by binary search of the cumulative
+        weights; tier two picks uniformly within the group.
+        """
+        rand = bisect_right(self.cum_weights, self._random() * self.total_weight)
+        if rand < self.singleton_count:
+            return self._singleton_nums[rand]
+        nums_len = self.group_lens[rand]
+        return self.group_nums[rand][self._randrange(nums_len)]
+
+    def getNumbers(self, k, replace=True):
+        """Return k randomly selected numbers in one call.
+
+        With NumPy installed and the two-tier alias tables built, all k draws are
+        performed with vectorized array operations (a NumPy int64 array is
+        returned), amortizing the per-call interpreter overhead across the batch.
+        Otherwise the batch falls back to k individual getNumber calls and a list
+        is returned.
+
+        With replace=False the k returned numbers are distinct (see
+        _getDistinctNumbers); k may not exceed the population size.
+        """
+        if not replace:
+            return self._getDistinctNumbers(k)
+        if self._np_flat_nums is None or self.method == 'simple':
+            return [self.getNumber() for _ in range(k)]
+        rng = self._np_rng
+        group = rng.integers(0, len(self._np_alias_prob), size=k)
+        accept = rng.random(k) < self._np_alias_prob[group]
+        group = numpy.where(accept, group, self._np_alias_idx[group])
+        member = (rng.random(k) * self._np_group_lens[group]).astype(numpy.int64)
+        return self._np_flat_nums[self._np_group_offsets[group] + member]
+
+    def _getDistinctNumbers(self, k):
+        """Return k distinct numbers, weighted by their probabilities.
+
+        With a single weight group every number is equally likely, so Robert
+        Floyd's algorithm draws the k-subset in O(k) work regardless of the
+        population size. Otherwise each number gets an Efraimidis-Spirakis
+        reservoir key (uniform ** (1/weight)) and the k largest keys win;
+        NumPy computes the keys and the top-k partition in C when available.
+        """
+        if k > self.population_size:
+            raise ValueError(f"Cannot draw {k} distinct numbers from a "
+                                 f"population of {self.population_size}")
+        if not k:
+            # argpartition rejects an empty selection, so decide k=0 here and
+            # keep all three paths agreeing.
+            return []
+        if self.tier_one_size == 1:
+            nums = self.group_nums[0]
+            chosen = set()
+            result = []
+            for j in range(self.population_size - k, self.population_size):
+                t = self._randrange(j + 1)
+                if t in chosen:
+                    t = j
+                chosen.add(t)
+                result.append(nums[t])
+            return result
+        if numpy is not None:
+            weights = numpy.array(self.probabilities)
+            keys = self._np_rng.random(self.population_size) ** (1.0 / weights)
+            cut = self.population_size - k
+            top = numpy.argpartition(keys, cut)[cut:]
+            return [self.numbers[i] for i in top]
+        rand = self._random
+        probs = self.probabilities
+        top = nlargest(k, range(self.population_size),
+                       key=lambda i: rand() ** (1.0 / probs[i]))
+        return [self.numbers[i] for i in top]
+
+    def sampleCounts(self, k):
+        """Return a dictionary of number-to-count tallies over k random draws.
+
+        With Numba and NumPy installed, the draw loop runs as compiled machine
+        code over the alias arrays and the tally is a single C-level
+        numpy.unique call. Otherwise the draws and tally run as an interpreted
+        loop over getNumber.
+        """
+        if _sampleAlias is not None and self._np_flat_nums is not None \
+                and self.method != 'simple':
+            out = numpy.empty(k, dtype=numpy.int64)
+            # Seed the kernel from the instance RNG rather than the instance
+            # seed itself: successive batches stay independent (reseeding with
+            # a constant would replay the same sample stream every call) while
+            # a seeded DartBoard still reproduces the same batch sequence.
+            _sampleAlias(self._np_alias_prob, self._np_alias_idx,
+                         self._np_group_lens, self._np_group_offsets,
+                         self._np_flat_nums, out, self._rng.getrandbits(63))
+            values, tallies = numpy.unique(out, return_counts=True)
+            return dict(zip(values.tolist(), tallies.tolist()))
+        counts = {}
+        for _ in range(k):
+            number = self.getNumber()
+            counts[number] = counts.get(number, 0) + 1
+        return counts
 
     def createTable(self):
         self._normalizeProbabilities()
         self._createWeightGroups()
-        self._createSelectionTable()
+        if self.method == 'bisect':
+            self._createCumulativeTable()
+        else:
+            self._createAliasTable()
+            self._createSelectionTable()
+        self._specializeGetNumber()
@@ -40,6 +40,13 @@ import sys
 import time
 import unittest
 
+try:
+    import numpy
+except ImportError:
+    # NumPy is optional for the tests; without it, sample tallies fall back to
+    # a Python counting loop.
+    numpy = None
+
 
 leading_nl = True
 
@@ -197,12 +204,20 @@ class DBTest:
         interrupted = False
         start_time = time.time()
         try:
-            for i in range(sample_size):
-                number = self.db.getNumber()
-                counts[number] += 1
+            numbers = self.db.getNumbers(sample_size)
+            if numpy is not None and isinstance(numbers, numpy.ndarray):
+                # One C call tallies the whole batch; the numbers in these
+                # tests are small non-negative ints, so bincount applies.
+                tallies = numpy.bincount(numbers)
+                for n in counts:
+                    if n < len(tallies):
+                        counts[n] = int(tallies[n])
+            else:
+                for number in numbers:
+                    counts[number] += 1
         except KeyboardInterrupt:
             interrupted = True
-            prt(f"Keyboard Interrupt -- {i} samples collected")
+            prt(f"Keyboard Interrupt -- sample collection abandoned")
         end_time = time.time()
         collect_time = end_time - start_time
 
@@ -297,6 +312,10 @@ class DartBoardUnitTest(unittest.TestCase, DBTest):
         num_list = self.genDataSet(0.01)
         self.create(num_list, get_method='two-tier')
 
+    def test_bisect_method(self):
+        num_list = self.genDataSet(0.01)
+        self.create(num_list, get_method='bisect')
+
     def test_invalid_method(self):
         num_list = self.genDataSet(0.1)
         self.create(num_list, get_method='three-tier', errs=ValueError())
@@ -309,9 +328,22 @@ class DartBoardUnitTest(unittest.TestCase, DBTest):
         num_list = self.genDataSet(0.01)
         db1 = self.create(num_list, seed=12345)
         db2 = self.create(num_list, seed=12345)
-        self.assertEqual(db1.selection_table, db2.selection_table,
+        self.assertEqual((db1.alias_prob, db1.alias_idx), (db2.alias_prob, db2.alias_idx),
                          "Same random seed did not produce identical sample sets")
 
+    def test_distinct_numbers(self):
+        num_list = self.genDataSet(0.01)
+        db = self.create(num_list)
+        k = len(num_list) // 2
+        selection = db.getNumbers(k, replace=False)
+        self.assertEqual(len(set(selection)), k,
+                         "Distinct selection returned repeated numbers")
+        population = {n for n, _ in num_list}
+        self.assertTrue(population.issuperset(selection),
+                        "Distinct selection returned numbers outside the population")
+        with self.assertRaises(ValueError):
+            db.getNumbers(len(num_list) + 1, replace=False)
+
     def test_small_population_validate(self):
         num_list = self.genDataSet(0.1)
         self.create(num_list)
@@ -408,11 +440,13 @@ class DartBoardFunctionalTest(unittest.TestCase, DBTest):
 ###  MAIN PROCEDURE
 ###################################################################################################
 
-# Determine if running under debug (Python debugger or Pycharm debug)
+# Determine if running under debug (Python debugger or Pycharm debug). Numba
+# (an optional dartboard dependency) is exempt: importing it loads modules such
+# as numba.core.debuginfo that would otherwise trip this name heuristic.
 in_debug = False
 mods = list(sys.modules.keys())
 for mod in mods:
-    if 'dbg' in mod or 'debug' in mod:
+    if ('dbg' in mod or 'debug' in mod) and not mod.startswith('numba'):
         in_debug = True
         break
 